@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 
 def plot_advect1d():
@@ -10,12 +11,18 @@ def plot_advect1d():
     ax1.plot(x, p, '-o', mfc='none')
     plt.show()
 
+def load_solution(filename):
+    return pd.read_csv(filename, sep=r'\s+', header=None, comment='#', dtype=np.float64, engine='c').values
+
 def plot_advect1d_blocks():
     import glob
+    from concurrent.futures import ThreadPoolExecutor
     fig = plt.figure(figsize=[10, 10])
     ax1 = fig.add_subplot(1, 1, 1)
-    for filename in glob.glob("solution-*.dat"):
-        x, p = np.loadtxt(filename).T
+    with ThreadPoolExecutor() as executor:
+        arrs = list(executor.map(load_solution, glob.glob("solution-*.dat")))
+    for arr in arrs:
+        x, p = arr.T
         ax1.plot(x, p, '-o', mfc='none')
     plt.show()
 
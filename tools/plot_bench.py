@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 
 import argparse
-import csv
 import math
 import platform
+import pandas as pd
 import psutil
 import cpuinfo
 import matplotlib.pyplot as plt
@@ -68,28 +68,20 @@ def get_sys_info():
 
 
 def read_results(file):
-    results = {}
-    with open(file) as csv_file:
-        csv_reader = csv.DictReader(csv_file, delimiter=',')
-        line_count = 0
-        for row in csv_reader:
-            if int(row['GridSize']) not in results:
-                results[int(row['GridSize'])] = []
-            results[int(row['GridSize'])].append({
-                't': int(row['NumThreads']),
-                'p': int(row['BlockSize']),
-                'sec': float(row['TotalSec'])})
-            line_count += 1
-
-    return results
-
-
-def extract_ts(results, grid, block):
-    g = results[grid]
-    line = [[row['t'], row['sec']] for row in g if row['p'] == block]
-    line.sort()
-    x = [a[0] for a in line]
-    y = [a[1] for a in line]
+    return pd.read_csv(file, dtype={
+        'NumThreads': 'int32',
+        'GridSize': 'int32',
+        'BlockSize': 'int32',
+        'TotalSec': 'float64'})
+
+
+def extract_ts(series, grid, block):
+    if (grid, block) not in series.groups:
+        # grids may have been swept with different sets of block sizes
+        return None
+    line = series.get_group((grid, block)).sort_values('NumThreads')
+    x = line['NumThreads'].to_numpy()
+    y = line['TotalSec'].to_numpy()
     return x, y
 
 
@@ -99,14 +91,11 @@ args = parse_args()
 # Load CSV test results
 source_csv = args['input']
 results = read_results(source_csv)
+series = results.groupby(['GridSize', 'BlockSize'])
 
 # construct the set of block sizes and grid sizes
-patch_sz = set()
-grid_sz = set()
-for k in results:
-    for row in results[k]:
-        patch_sz.add(row['p'])
-        grid_sz.add(k)
+patch_sz = set(results['BlockSize'].unique().tolist())
+grid_sz = set(results['GridSize'].unique().tolist())
 
 # restrict the patches that will be charted to those given in the `blocks`
 # argument
@@ -135,13 +124,17 @@ plt.suptitle('CPU:{}\nMemory: {}'.format(
     sys_info['cpu']['name'], sys_info['total_memory']))
 
 subplot = 1
+x, ideal = [], []
 for g in grid_sz:
     plt.subplot(rows, cols, subplot)
     subplot += 1
     for p in patch_sz:
-        x, y = extract_ts(results, g, p)
-        r = [1 / yi for yi in y]
-        ideal = [r[0] * xi / x[0] for xi in x]
+        ts = extract_ts(series, g, p)
+        if ts is None:
+            continue
+        x, y = ts
+        r = 1 / y
+        ideal = r[0] * x / x[0]
         plt.plot(x, r, '-o', mfc='none', label='N={} B={}'.format(g, p))
         plt.xlabel('Threads')
         plt.ylabel('Rate [1/s]')
@@ -1,38 +1,95 @@
 #!/usr/bin/env python3
 
+import concurrent.futures
+import os
 import subprocess
+import sys
+import tempfile
+import threading
 import time
+import psutil
+
+PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# cargo resolves a relative CARGO_TARGET_DIR against its working directory,
+# which for the build below is the package root
+TARGET_DIR = os.path.join(PACKAGE_DIR, os.environ.get("CARGO_TARGET_DIR", "target"))
+EULER_BIN = os.path.join(TARGET_DIR, "release", "examples", "euler")
+EULER_ARGS = [EULER_BIN, "--strategy", "stupid", "--tfinal", str(0.02)]
 
 def euler_cmd(t, n, b):
-    return [
-        "cargo", "-q", "run", "--release", "--example",
-        "euler", "--",
-        "-t", str(t),
-        "-n", str(n),
-        "-b", str(b),
-        "--strategy", "stupid",
-        "--tfinal", str(0.02)]
+    return EULER_ARGS + ["-t", str(t), "-n", str(n), "-b", str(b)]
+
+
+# the euler processes currently running, so that the main thread can kill
+# them as soon as one configuration fails
+running = set()
+running_lock = threading.Lock()
+stopping = False
+
+
+def run_cmd(cmd, cwd):
+    with running_lock:
+        if stopping:
+            return None
+        out = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        running.add(out)
+    _, stderr = out.communicate()
+    with running_lock:
+        running.discard(out)
+    return stderr
+
 
+def kill_running():
+    global stopping
+    with running_lock:
+        stopping = True
+        for out in running:
+            out.kill()
 
-def run_cmd(cmd):
-    out = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    stdout, stderr = out.communicate()
-    return stdout, stderr
+
+def run_config(cfg):
+    # each run writes its state.cbor into its own scratch directory, so that
+    # concurrent runs do not clobber one another's output
+    with tempfile.TemporaryDirectory() as cwd:
+        start = time.perf_counter_ns()
+        err = run_cmd(euler_cmd(*cfg), cwd)
+        elapsed_ns = time.perf_counter_ns() - start
+    return cfg, elapsed_ns, err
+
+
+def print_results(times):
+    print("NumThreads,GridSize,BlockSize,TotalSec")
+    for (t, n, b), elapsed_ns in sorted(times, key=lambda r: (r[0][1], r[0][2], r[0][0])):
+        print('{},{},{},{}'.format(t, n, b, elapsed_ns / 1e9))
 
 
 threads = range(2, 29)
 grid = [2400]
 patch = [50, 100, 200]
 
-print("NumThreads,GridSize,BlockSize,TotalSec")
-for n in grid:
-    for b in patch:
-        for t in threads:
-            ec = euler_cmd(t, n, b)
-            start = time.time()
-            out, err = run_cmd(ec)
-            if err:
-                print(err)
-                exit()
-            sec = time.time() - start
-            print('{},{},{},{}'.format(t, n, b, sec))
+# build the example once, so the sweep can invoke the binary directly rather
+# than paying for cargo's fingerprint checks on every run
+subprocess.check_call(["cargo", "build", "--release", "--example", "euler"], cwd=PACKAGE_DIR)
+
+# run the largest thread counts first, and only as many configurations at
+# once as there are cores for the largest of them
+configs = [(t, n, b) for n in grid for b in patch for t in threads]
+configs.sort(key=lambda cfg: cfg[0], reverse=True)
+# psutil returns None where it cannot determine the physical core count
+phys_cores = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+workers = max(1, phys_cores // max(threads))
+
+times = []
+with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+    futures = [executor.submit(run_config, cfg) for cfg in configs]
+    for future in concurrent.futures.as_completed(futures):
+        cfg, elapsed_ns, err = future.result()
+        if err:
+            print(err.decode(), file=sys.stderr)
+            kill_running()
+            executor.shutdown(cancel_futures=True)
+            print_results(times)
+            sys.exit(1)
+        times.append((cfg, elapsed_ns))
+
+print_results(times)